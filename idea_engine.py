@@ -0,0 +1,249 @@
+import random
+from itertools import zip_longest
+from datetime import datetime
+
+
+IDEA_TEMPLATES = {
+    "Tutorial": [
+        "How to {angle} in {niche} for {audience}",
+        "Step-by-step guide: {angle} with {niche}",
+        "{niche} masterclass: {angle} from scratch",
+        "The fastest way to {angle} in {niche}",
+        "{niche} for {audience}: learn to {angle} in one weekend",
+        "Stop making these mistakes when you {angle} in {niche}",
+    ],
+    "Review": [
+        "Honest {niche} review: does it help you {angle}?",
+        "I tested every {niche} tool to {angle} so you don't have to",
+        "Best {niche} picks to {angle} for {audience}",
+        "Is it worth it? {niche} gear to {angle} ranked",
+        "{niche} budget vs premium: which one helps you {angle}?",
+        "Overrated or underrated: {niche} products to {angle}",
+    ],
+    "Behind the Scenes": [
+        "Behind the scenes: how we {angle} in {niche}",
+        "A day in my {niche} life trying to {angle}",
+        "What nobody shows you about trying to {angle} in {niche}",
+        "My real {niche} workflow to {angle}",
+        "Inside my {niche} setup: built to {angle}",
+        "The messy truth about how I {angle} in {niche}",
+    ],
+    "Interview": [
+        "I asked a {niche} expert how to {angle}",
+        "{niche} pros answer: the secret to {angle}",
+        "Interviewing {audience} about how they {angle} in {niche}",
+        "Q&A: what it really takes to {angle} in {niche}",
+        "Lessons from a {niche} veteran on how to {angle}",
+        "Hot seat: {niche} creators debate the best way to {angle}",
+    ],
+    "Challenge": [
+        "30-day {niche} challenge: can I {angle}?",
+        "I tried to {angle} in {niche} with zero budget",
+        "{niche} speedrun: {angle} in 24 hours",
+        "Challenge accepted: {angle} in {niche} using only free tools",
+        "Beginner vs pro: who can {angle} in {niche} faster?",
+        "{audience} try to {angle} in {niche} for the first time",
+    ],
+}
+
+IDEA_ANGLES = [
+    "get started", "save money", "save time", "level up fast", "avoid burnout",
+    "grow an audience", "go viral", "build a daily habit", "automate the boring parts",
+    "use AI tools", "stay consistent", "beat the algorithm", "get better results",
+    "turn it into income", "learn the basics", "master advanced techniques",
+    "fix common problems", "stand out from the crowd", "work smarter", "build a community",
+    "plan a whole month", "recover from failure", "find your niche", "break bad habits",
+    "set realistic goals", "measure real progress", "collaborate with others",
+    "teach someone else", "go pro", "upgrade on a budget", "start over in 2 weeks",
+    "organize your workspace", "overcome creative block", "pick the right gear",
+    "learn from mistakes", "copy the experts", "try something weird", "keep it simple",
+    "make it sustainable", "handle criticism", "launch a side project", "network with peers",
+    "travel light", "work from home", "document everything", "test popular myths",
+    "follow a strict schedule", "build a portfolio", "get sponsored", "teach kids",
+    "go fully offline", "win a competition", "repair old equipment", "rebuild from scratch",
+    "compare old and new methods", "predict next year", "explain it in 60 seconds",
+    "review your first attempt", "answer viewer questions", "react to trending posts",
+]
+
+IDEA_AUDIENCES = [
+    "beginners", "busy professionals", "students", "parents", "creators", "small budgets",
+]
+
+# Kept clear of audience words and fixed template wording, which would give
+# template ideas a trend bonus regardless of their angle
+DEFAULT_TREND_KEYWORDS = ["ai", "viral", "fast", str(datetime.now().year), "money", "habit", "myths"]
+
+IDEAS_PER_PAGE = 20
+
+IDEAS_PER_CALL = 100
+
+ANGLES_PER_CALL = 12
+
+
+def template_capacity(content_types):
+    # Audiences only change one or two words and collapse under dedup, so the
+    # distinct ideas the local engine can offer are templates x angles
+    return sum(len(IDEA_TEMPLATES.get(content_type, [])) for content_type in content_types) * len(IDEA_ANGLES)
+
+
+def template_ideas(niche, content_types, count):
+    # Local fallback used when no API key is set or the API call fails.
+    # Each idea is (content type, title, source), where the source is the
+    # template it came from; audiences rotate deterministically
+    candidates = [
+        (
+            content_type,
+            template.format(
+                niche=niche, angle=angle,
+                audience=IDEA_AUDIENCES[(template_index + angle_index) % len(IDEA_AUDIENCES)]
+            ),
+            template
+        )
+        for content_type in content_types
+        for template_index, template in enumerate(IDEA_TEMPLATES.get(content_type, []))
+        for angle_index, angle in enumerate(IDEA_ANGLES)
+    ]
+    random.shuffle(candidates)
+    return candidates[:count]
+
+
+def idea_chunks(count):
+    # Split an API request into chunks that fit one response, each steered
+    # towards its own slice of angles so the calls do not repeat each other
+    chunks = []
+    for chunk_index, start in enumerate(range(0, count, IDEAS_PER_CALL)):
+        first = chunk_index * ANGLES_PER_CALL
+        angles = [IDEA_ANGLES[(first + i) % len(IDEA_ANGLES)] for i in range(ANGLES_PER_CALL)]
+        chunks.append((min(IDEAS_PER_CALL, count - start), angles))
+    return chunks
+
+
+def parse_idea_lines(lines, content_types):
+    # Match types loosely so "**Tutorial**:" or "tutorial:" still count
+    types_by_name = {content_type.casefold(): content_type for content_type in content_types}
+    ideas = []
+    for line in lines:
+        idea_type, sep, title = line.strip().lstrip("-*0123456789. ").partition(":")
+        idea_type = types_by_name.get(idea_type.strip(" *_\"'`").casefold())
+        title = title.strip(" *_\"'`")
+        if sep and idea_type and title:
+            ideas.append((idea_type, title, idea_type))
+    return ideas
+
+
+def idea_words(text):
+    return "".join(c if c.isalnum() else " " for c in text.lower()).split()
+
+
+def idea_shingles(text, niche_words=()):
+    # Collapse the niche phrase into one token so a long niche does not make
+    # every idea look alike
+    words = idea_words(text)
+    size = len(niche_words)
+    if size:
+        collapsed = []
+        i = 0
+        while i < len(words):
+            if words[i:i + size] == list(niche_words):
+                collapsed.append("<niche>")
+                i += size
+            else:
+                collapsed.append(words[i])
+                i += 1
+        words = collapsed
+    return set(zip(words, words[1:])) or set(words)
+
+
+def matches_keyword(words, keyword):
+    # Whole-word match, so "ai" does not hit "daily" or "painting"
+    keyword_words = idea_words(keyword)
+    size = len(keyword_words)
+    return size > 0 and any(
+        words[i:i + size] == keyword_words for i in range(len(words) - size + 1)
+    )
+
+
+def shingle_overlaps(shingles, index):
+    overlaps = {}
+    for shingle in shingles:
+        for i in index.get(shingle, ()):
+            overlaps[i] = overlaps.get(i, 0) + 1
+    return overlaps
+
+
+def max_similarity(shingles, overlaps, kept_shingles, skip=None):
+    similarity = 0.0
+    for i, overlap in overlaps.items():
+        if i != skip:
+            union = len(shingles) + len(kept_shingles[i]) - overlap
+            similarity = max(similarity, overlap / union)
+    return similarity
+
+
+def dedupe_ideas(ideas, niche="", threshold=0.6, limit=None):
+    # Inverted index from shingle to kept ideas, so each candidate is only
+    # compared against ideas it actually shares shingles with
+    niche_words = idea_words(niche)
+    index = {}
+    kept_shingles = []
+    kept = []
+
+    for idea in ideas:
+        if limit is not None and len(kept) >= limit:
+            break
+        shingles = idea_shingles(idea[1], niche_words)
+        overlaps = shingle_overlaps(shingles, index)
+        if max_similarity(shingles, overlaps, kept_shingles) >= threshold:
+            continue
+
+        for shingle in shingles:
+            index.setdefault(shingle, []).append(len(kept))
+        kept_shingles.append(shingles)
+        kept.append(idea)
+
+    # Novelty is measured against the whole kept set, not just earlier
+    # candidates, so it does not depend on the order ideas arrived in
+    return [
+        (idea_type, title, source, 1.0 - max_similarity(
+            shingles, shingle_overlaps(shingles, index), kept_shingles, skip=i
+        ))
+        for i, ((idea_type, title, source), shingles) in enumerate(zip(kept, kept_shingles))
+    ]
+
+
+def fill_idea_pool(ideas, niche, content_types, count):
+    # Dedup first, then top up from the local templates until there are
+    # count unique ideas or the templates run out
+    candidates = list(ideas) + template_ideas(niche, content_types, template_capacity(content_types))
+    return dedupe_ideas(candidates, niche, limit=count)
+
+
+def rank_ideas(ideas, trend_keywords, novelty_weight=0.6):
+    # Raw novelty mostly reflects template length, so it is rescaled within
+    # each source (template, or content type for API ideas) before scoring
+    novelty_ranges = {}
+    for _, _, source, novelty in ideas:
+        low, high = novelty_ranges.get(source, (novelty, novelty))
+        novelty_ranges[source] = (min(low, novelty), max(high, novelty))
+
+    scored = []
+    for idea_type, title, source, novelty in ideas:
+        low, high = novelty_ranges[source]
+        novelty = (novelty - low) / (high - low) if high > low else 1.0
+        words = idea_words(title)
+        trend = (
+            sum(matches_keyword(words, keyword) for keyword in trend_keywords) / len(trend_keywords)
+            if trend_keywords else 0.0
+        )
+        score = novelty_weight * novelty + (1 - novelty_weight) * trend
+        scored.append((source, {'Type': idea_type, 'Idea': title, 'Score': round(score, 3)}))
+    scored.sort(key=lambda item: item[1]['Score'], reverse=True)
+
+    # Interleave sources round by round so the first page is not one template
+    groups = {}
+    for source, idea in scored:
+        groups.setdefault(source, []).append(idea)
+    ranked = []
+    for round_ideas in zip_longest(*groups.values()):
+        ranked.extend(idea for idea in round_ideas if idea is not None)
+    return ranked
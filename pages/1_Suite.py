@@ -7,6 +7,10 @@ import plotly.express as px
 import plotly.graph_objects as go
 import json
 import numpy as np
+from idea_engine import (
+    IDEA_TEMPLATES, DEFAULT_TREND_KEYWORDS, IDEAS_PER_PAGE,
+    template_capacity, fill_idea_pool, rank_ideas
+)
 
 # Page Configuration
 st.set_page_config(layout="wide", page_title="Content Creator Suite")
@@ -183,16 +187,32 @@ def idea_generator():
     niche = st.text_input("Your Content Niche")
     content_type = st.multiselect(
         "Content Types",
-        ["Tutorial", "Review", "Behind the Scenes", "Interview", "Challenge"]
+        list(IDEA_TEMPLATES)
     )
+    trend_input = st.text_input("Trend Keywords (comma-separated)", ", ".join(DEFAULT_TREND_KEYWORDS))
+    trend_keywords = [keyword.strip() for keyword in trend_input.split(",") if keyword.strip()]
 
     if niche and content_type and st.button("Generate Ideas"):
-        st.subheader("Content Ideas")
-
-        # Mock idea generation
-        for _ in range(10):
-            idea_type = random.choice(content_type)
-            st.write(f"- {idea_type}: {niche}-related content idea here")
+        # Local template engine, no API key needed
+        pool = fill_idea_pool([], niche, content_type, template_capacity(content_type))
+        st.session_state.idea_pool = pool
+        st.session_state.idea_pool_key = (niche, tuple(content_type))
+        st.session_state.idea_page = 1
+
+    # Results live in session state so paging does not trigger a new generation.
+    # They are only shown for the niche and types they were generated from, and
+    # are re-ranked on each run so trend keyword edits apply straight away
+    pool = st.session_state.get('idea_pool')
+    if pool and st.session_state.get('idea_pool_key') == (niche, tuple(content_type)):
+        ideas = rank_ideas(pool, trend_keywords)
+        st.subheader(f"Content Ideas ({len(ideas)} unique)")
+
+        page_count = (len(ideas) - 1) // IDEAS_PER_PAGE + 1
+        page = st.number_input("Page", min_value=1, max_value=page_count, key='idea_page')
+        start = (page - 1) * IDEAS_PER_PAGE
+
+        for idea in ideas[start:start + IDEAS_PER_PAGE]:
+            st.write(f"- {idea['Type']}: {idea['Idea']} (score {idea['Score']})")
 
 
 def trend_analysis():
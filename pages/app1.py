@@ -7,6 +7,10 @@ from datetime import datetime, timedelta
 import random
 import json
 import openai
+from idea_engine import (
+    IDEA_TEMPLATES, DEFAULT_TREND_KEYWORDS, IDEAS_PER_PAGE,
+    template_capacity, idea_chunks, parse_idea_lines, dedupe_ideas, fill_idea_pool, rank_ideas
+)
 
 # Initialize OpenAI API
 if 'openai_api_key' not in st.session_state:
@@ -179,22 +183,86 @@ def marketing_planner():
         st.slider("Total Budget ($)", 0, 10000, 1000)
 
 
+def request_ideas(niche, content_types, count, angles):
+    prompt = f"""Generate {count} distinct video content ideas for the niche "{niche}".
+                Use only these content types: {', '.join(content_types)}.
+                Focus on these angles: {', '.join(angles)}.
+                Return one idea per line in the format:
+                <Content Type>: <Idea title>
+                Do not number the lines or add any other text."""
+
+    response = openai.ChatCompletion.create(
+        model="gpt-3.5-turbo",
+        messages=[
+            {"role": "system", "content": "You are a creative content strategist."},
+            {"role": "user", "content": prompt}
+        ],
+        temperature=0.9,
+        max_tokens=count * 25
+    )
+    return response.choices[0].message.content.splitlines()
+
+
+def generate_ideas_batch(niche, content_types, count):
+    lines = []
+    if st.session_state.openai_api_key:
+        try:
+            for chunk_count, angles in idea_chunks(count):
+                lines.extend(request_ideas(niche, content_types, chunk_count, angles))
+        except Exception as e:
+            st.warning(f"Falling back to local idea templates: {str(e)}")
+
+    ideas = parse_idea_lines(lines, content_types)
+    pool = fill_idea_pool(ideas, niche, content_types, count)
+
+    api_count = len(dedupe_ideas(ideas, niche, limit=count))
+    if st.session_state.openai_api_key and api_count < len(pool):
+        st.info(f"Added {len(pool) - api_count} ideas from the local template engine.")
+    if len(pool) < count:
+        st.caption(f"Only {len(pool)} unique ideas could be generated for these inputs.")
+    return pool
+
+
 def idea_generator():
     st.header("Content Idea Generator")
 
     niche = st.text_input("Your Content Niche")
     content_type = st.multiselect(
         "Content Types",
-        ["Tutorial", "Review", "Behind the Scenes", "Interview", "Challenge"]
+        list(IDEA_TEMPLATES)
     )
+    idea_count = st.slider("Ideas to Generate", 50, 500, 200, step=50)
+    if not st.session_state.openai_api_key and content_type:
+        capacity = template_capacity(content_type)
+        st.caption(f"The local template engine offers up to {capacity} ideas for the selected types.")
+        idea_count = min(idea_count, capacity)
+    trend_input = st.text_input("Trend Keywords (comma-separated)", ", ".join(DEFAULT_TREND_KEYWORDS))
+    trend_keywords = [keyword.strip() for keyword in trend_input.split(",") if keyword.strip()]
+
+    if not st.session_state.openai_api_key:
+        st.info("No OpenAI API key set: ideas come from the local template engine.")
 
     if niche and content_type and st.button("Generate Ideas"):
-        st.subheader("Content Ideas")
+        with st.spinner("Generating ideas..."):
+            pool = generate_ideas_batch(niche, content_type, idea_count)
+            st.session_state.idea_pool = pool
+            st.session_state.idea_pool_key = (niche, tuple(content_type))
+            st.session_state.idea_page = 1
+
+    # Results live in session state so paging does not trigger a new generation.
+    # They are only shown for the niche and types they were generated from, and
+    # are re-ranked on each run so trend keyword edits apply straight away
+    pool = st.session_state.get('idea_pool')
+    if pool and st.session_state.get('idea_pool_key') == (niche, tuple(content_type)):
+        ideas = rank_ideas(pool, trend_keywords)
+        st.subheader(f"Content Ideas ({len(ideas)} unique)")
+
+        page_count = (len(ideas) - 1) // IDEAS_PER_PAGE + 1
+        page = st.number_input("Page", min_value=1, max_value=page_count, key='idea_page')
+        start = (page - 1) * IDEAS_PER_PAGE
 
-        # Mock idea generation
-        for _ in range(10):
-            idea_type = random.choice(content_type)
-            st.write(f"- {idea_type}: {niche}-related content idea here")
+        for idea in ideas[start:start + IDEAS_PER_PAGE]:
+            st.write(f"- {idea['Type']}: {idea['Idea']} (score {idea['Score']})")
 
 
 def trend_analysis():
@@ -315,7 +383,8 @@ def sidebar_menu():
 def main():
     page = sidebar_menu()
     
-    if not initialize_openai() and page not in ["Settings"]:
+    # The idea generator falls back to local templates, so it works without a key
+    if not initialize_openai() and page not in ["Settings", "Idea Generator"]:
         st.warning("Please set your OpenAI API key in Settings first!")
         settings()
         return
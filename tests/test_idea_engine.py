@@ -0,0 +1,139 @@
+from idea_engine import (
+    IDEA_ANGLES, IDEA_AUDIENCES, IDEA_TEMPLATES, DEFAULT_TREND_KEYWORDS, IDEAS_PER_CALL,
+    template_capacity, template_ideas, idea_chunks, parse_idea_lines,
+    idea_words, matches_keyword, dedupe_ideas, fill_idea_pool, rank_ideas
+)
+
+
+def test_template_capacity_is_templates_times_angles():
+    assert template_capacity(["Tutorial"]) == len(IDEA_TEMPLATES["Tutorial"]) * len(IDEA_ANGLES)
+    assert template_capacity(["Tutorial", "Review"]) == 2 * template_capacity(["Tutorial"])
+    assert template_capacity(["Unknown"]) == 0
+
+
+def test_template_ideas_respects_count_and_types():
+    ideas = template_ideas("cooking", ["Review", "Challenge"], 50)
+    assert len(ideas) == 50
+    assert {idea_type for idea_type, _, _ in ideas} <= {"Review", "Challenge"}
+    assert all("cooking" in title for _, title, _ in ideas)
+    assert all(source in IDEA_TEMPLATES[idea_type] for idea_type, _, source in ideas)
+
+
+def test_template_ideas_pick_audiences_deterministically():
+    first = set(template_ideas("cooking", ["Tutorial"], template_capacity(["Tutorial"])))
+    second = set(template_ideas("cooking", ["Tutorial"], template_capacity(["Tutorial"])))
+    assert first == second
+
+
+def test_default_trend_keywords_avoid_template_wording():
+    template_words = set()
+    for templates in IDEA_TEMPLATES.values():
+        for template in templates:
+            template_words.update(idea_words(template.format(niche="", angle="", audience="")))
+    for audience in IDEA_AUDIENCES:
+        template_words.update(idea_words(audience))
+    for keyword in DEFAULT_TREND_KEYWORDS:
+        assert not set(idea_words(keyword)) & template_words
+
+
+def test_idea_chunks_split_count_and_vary_angles():
+    chunks = idea_chunks(450)
+    assert [size for size, _ in chunks] == [IDEAS_PER_CALL] * 4 + [450 - 4 * IDEAS_PER_CALL]
+    angle_sets = [frozenset(angles) for _, angles in chunks]
+    assert len(set(angle_sets)) == len(chunks)
+    assert not angle_sets[0] & angle_sets[1]
+
+
+def test_parse_idea_lines_normalizes_types():
+    lines = [
+        "**Tutorial**: How to knead dough",
+        "tutorial: \"Bread for beginners\"",
+        "3. Review: Best ovens ranked",
+        "Interview: Not a selected type",
+        "No separator here",
+        "Tutorial:   ",
+    ]
+    assert parse_idea_lines(lines, ["Tutorial", "Review"]) == [
+        ("Tutorial", "How to knead dough", "Tutorial"),
+        ("Tutorial", "Bread for beginners", "Tutorial"),
+        ("Review", "Best ovens ranked", "Review"),
+    ]
+
+
+def test_matches_keyword_uses_whole_words():
+    words = idea_words("A daily painting habit with AI tools")
+    assert matches_keyword(words, "ai")
+    assert matches_keyword(words, "AI tools")
+    assert not matches_keyword(words, "dai")
+    assert not matches_keyword(idea_words("Painting every day"), "ai")
+    assert not matches_keyword(words, "")
+
+
+def test_dedupe_drops_exact_and_near_duplicates():
+    ideas = [
+        ("Tutorial", "How to bake sourdough bread at home", "Tutorial"),
+        ("Tutorial", "How to bake sourdough bread at home", "Tutorial"),
+        ("Tutorial", "How to bake sourdough bread at home today", "Tutorial"),
+        ("Review", "Best stand mixers ranked for small kitchens", "Review"),
+    ]
+    kept = dedupe_ideas(ideas)
+    assert [title for _, title, _, _ in kept] == [
+        "How to bake sourdough bread at home",
+        "Best stand mixers ranked for small kitchens",
+    ]
+
+
+def test_dedupe_ignores_long_niche_phrases():
+    niche = "home cooking on a tight budget for families"
+    ideas = template_ideas(niche, ["Tutorial"], template_capacity(["Tutorial"]))
+    assert len(dedupe_ideas(ideas, niche)) >= 300
+
+    ideas = template_ideas(niche, list(IDEA_TEMPLATES), 500)
+    assert len(dedupe_ideas(ideas, niche)) >= 400
+
+
+def test_dedupe_novelty_does_not_depend_on_order():
+    ideas = [
+        ("Tutorial", "How to bake sourdough bread at home", "Tutorial"),
+        ("Tutorial", "How to bake rye bread at home", "Tutorial"),
+        ("Review", "Best stand mixers ranked for small kitchens", "Review"),
+    ]
+    forward = {title: novelty for _, title, _, novelty in dedupe_ideas(ideas)}
+    backward = {title: novelty for _, title, _, novelty in dedupe_ideas(ideas[::-1])}
+    assert forward == backward
+    assert forward["Best stand mixers ranked for small kitchens"] == 1.0
+    assert forward["How to bake rye bread at home"] < 1.0
+
+
+def test_fill_idea_pool_tops_up_after_dedup():
+    repeated = [("Tutorial", "How to bake sourdough bread at home", "Tutorial")] * 50
+    pool = fill_idea_pool(repeated, "cooking", ["Tutorial"], 200)
+    assert len(pool) == 200
+    assert pool[0][1] == "How to bake sourdough bread at home"
+    assert sum(title == "How to bake sourdough bread at home" for _, title, _, _ in pool) == 1
+
+
+def test_fill_idea_pool_stops_when_templates_run_out():
+    pool = fill_idea_pool([], "cooking", ["Tutorial"], 10000)
+    assert 300 <= len(pool) <= template_capacity(["Tutorial"])
+
+
+def test_rank_ideas_sorts_by_score_and_rewards_trend_keywords():
+    ideas = [
+        ("Tutorial", "Plain idea", "Tutorial", 0.5),
+        ("Tutorial", "Viral AI idea", "Tutorial", 0.5),
+    ]
+    ranked = rank_ideas(ideas, ["ai", "viral"])
+    assert [idea["Idea"] for idea in ranked] == ["Viral AI idea", "Plain idea"]
+    assert ranked[0]["Score"] > ranked[1]["Score"]
+    assert rank_ideas(ideas, [])[0]["Score"] == 0.6
+
+
+def test_rank_ideas_spreads_the_first_page_across_templates():
+    content_types = list(IDEA_TEMPLATES)
+    ideas = template_ideas("cooking", content_types, 500)
+    ranked = rank_ideas(dedupe_ideas(ideas, "cooking"), DEFAULT_TREND_KEYWORDS)
+    source_by_title = {title: source for _, title, source in ideas}
+    first_page = [source_by_title[idea["Idea"]] for idea in ranked[:20]]
+    assert len(set(first_page)) == 20
+    assert {idea["Type"] for idea in ranked[:20]} == set(content_types)